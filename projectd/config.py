@@ -1,9 +1,8 @@
 import json
 from dataclasses import dataclass
 from enum import Enum
-
-from dacite import Config as DaciteConfig
-from dacite import from_dict
+from functools import lru_cache
+from typing import Any
 
 
 class TemplateType(Enum):
@@ -19,6 +18,15 @@ class TemplateConfig:
     output_file: str
     class_link_template: str
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "TemplateConfig":
+        return cls(
+            template_type=TemplateType(data["template_type"]),
+            template=data["template"],
+            output_file=data["output_file"],
+            class_link_template=data["class_link_template"],
+        )
+
 
 @dataclass
 class Config:
@@ -30,9 +38,22 @@ class Config:
     auto_escape: bool
     templates: list[TemplateConfig]
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Config":
+        return cls(
+            input_dirs=data["input_dirs"],
+            output_dir=data["output_dir"],
+            defines=data["defines"],
+            template_dir=data["template_dir"],
+            code_template=data["code_template"],
+            auto_escape=data["auto_escape"],
+            templates=[TemplateConfig.from_dict(template) for template in data["templates"]],
+        )
+
 
+@lru_cache(maxsize=1)
 def get_config() -> Config:
     with open("config.json") as config_file:
         config_json = json.load(config_file)
 
-    return from_dict(data_class=Config, data=config_json, config=DaciteConfig(cast=[TemplateType]))  # type: ignore[no-any-return]
+    return Config.from_dict(config_json)
@@ -1,25 +1,31 @@
 from dataclasses import dataclass, field
-from typing import Iterator, Literal
+from typing import Any, Iterator, Literal
 
+ElementType = Literal["text", "code", "verbatim"]
 
-@dataclass
+
+@dataclass(slots=True)
 class DocElement:
     text: str
-    element_type: Literal["text", "code", "verbatim"]
+    element_type: ElementType
 
     def __str__(self) -> str:
         return self.text
 
 
-@dataclass
+@dataclass(slots=True)
 class DocBlock:
     elements: list[DocElement] = field(default_factory=list)
 
     def __iter__(self) -> Iterator:
         return iter(self.elements)
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> "DocBlock":
+        # doc blocks aren't modified after parsing, so copies of the doc tree can share them
+        return self
+
 
-@dataclass
+@dataclass(slots=True)
 class CommandDoc:
     name: str
     doc: DocBlock = field(default_factory=DocBlock)
@@ -1,5 +1,6 @@
 import os
 import re
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from functools import cached_property
@@ -12,6 +13,12 @@ from projectd.doxygen_parser.dataclasses import CommandDoc, DocBlock, DocElement
 from projectd.doxygen_parser.process_lines import process_lines
 from projectd.doxygen_parser.utils import modify_sentence
 
+_PARAM_RE = re.compile(r"^param(?:\[(in|out|inout)\])?$")
+
+_CODE_ELEMENT_TYPES = frozenset(["code", "verbatim"])
+
+_EMPTY_KWARGS: dict[str, Any] = {"brief": None, "desc": None, "deprecated": None, "todo": None}
+
 
 class Direction(str, Enum):
     IN = "in"
@@ -19,7 +26,7 @@ class Direction(str, Enum):
     INOUT = "in,out"
 
 
-@dataclass
+@dataclass(slots=True)
 class Param:
     name: str
     desc: DocBlock
@@ -37,15 +44,20 @@ class EntityDoc:
 
     @classmethod
     def _from_doxygen_string(cls, doxygen: str | None) -> tuple[dict[str, Any], list[CommandDoc]]:
-        commands_and_data: list[CommandDoc] = []
-        if doxygen:
-            commands_and_data = process_lines(doxygen.splitlines())
+        if not doxygen:
+            return dict(_EMPTY_KWARGS), []
+
+        commands_and_data = process_lines(doxygen.splitlines())
+
+        first_docs: dict[str, DocBlock] = {}
+        for cmd in commands_and_data:
+            first_docs.setdefault(cmd.name, cmd.doc)
 
         kwargs = {
-            "brief": next((cmd.doc for cmd in commands_and_data if cmd.name == "brief"), None),
-            "desc": next((cmd.doc for cmd in commands_and_data if cmd.name == ""), None),
-            "deprecated": next((cmd.doc for cmd in commands_and_data if cmd.name == "deprecated"), None),
-            "todo": next((cmd.doc for cmd in commands_and_data if cmd.name == "todo"), None),
+            "brief": first_docs.get("brief"),
+            "desc": first_docs.get(""),
+            "deprecated": first_docs.get("deprecated"),
+            "todo": first_docs.get("todo"),
         }
         return kwargs, commands_and_data
 
@@ -65,23 +77,31 @@ class EntityDoc:
         namespace_docs: dict[str, "NamespaceDoc"],
         class_link: Callable[[str, str, str, str | None], str],
     ) -> str:
+        find_reference = self._find_reference
+
         def process_word(word: str) -> str:
             if word in ["@ref", "\\ref"]:
                 return ""
 
-            if entity := self._find_reference(re.split(r"::|#", word), namespace_docs):
+            if "::" in word or "#" in word:
+                normalized_word = word.replace("#", "::")
+                tokens = normalized_word.split("::")
+            else:
+                normalized_word = word
+                tokens = [word]
+            if entity := find_reference(tokens, namespace_docs):
                 if isinstance(entity, ClassDoc):
-                    return class_link(word.replace("#", "::"), entity.namespace.name, entity.name, "")
+                    return class_link(normalized_word, entity.namespace.name, entity.name, "")
                 if isinstance(entity, MethodDoc):
                     if entity.class_doc:
                         return class_link(
-                            word.replace("#", "::"), entity.class_doc.namespace.name, entity.class_doc.name, entity.name
+                            normalized_word, entity.class_doc.namespace.name, entity.class_doc.name, entity.name
                         )
                     return word
                 if isinstance(entity, AttributeDoc):
                     if entity.class_doc:
                         return class_link(
-                            word.replace("#", "::"), entity.class_doc.namespace.name, entity.class_doc.name, entity.name
+                            normalized_word, entity.class_doc.namespace.name, entity.class_doc.name, entity.name
                         )
                     return word
 
@@ -102,16 +122,21 @@ class EntityDoc:
         class_link: Callable[[str, str, str, str | None], str],
     ) -> DocBlock:
         doc_elements = []
+        changed = False
         for element in block.elements:
             updated_text = ""
-            if element.element_type in ["code", "verbatim"]:
+            if element.element_type in _CODE_ELEMENT_TYPES:
                 updated_text = code_template(element.text)
             elif element.element_type == "text":
                 updated_text = self._update_text_block(element.text, namespace_docs, class_link)
 
-            doc_elements.append(DocElement(text=updated_text, element_type=element.element_type))
+            if updated_text == element.text:
+                doc_elements.append(element)
+            else:
+                doc_elements.append(DocElement(text=updated_text, element_type=element.element_type))
+                changed = True
 
-        return DocBlock(elements=doc_elements)
+        return DocBlock(elements=doc_elements) if changed else block
 
     def post_process(
         self,
@@ -165,12 +190,10 @@ class MethodDoc(EntityDoc):
 
     @classmethod
     def parse_param(cls, param_doc: CommandDoc, params: list[Parameter]) -> Param | None:
-        param_pattern = r"^param(?:\[(in|out|inout)\])?$"
-
         if not param_doc.doc:
             return None
 
-        match = re.match(param_pattern, param_doc.name)
+        match = _PARAM_RE.match(param_doc.name)
 
         if not match:
             return None
@@ -190,7 +213,12 @@ class MethodDoc(EntityDoc):
             param_desc_block = DocBlock(
                 elements=[DocElement(text=param_desc, element_type="text")] + param_doc.doc.elements[1:]
             )
-            return Param(name=param_name, desc=param_desc_block, direction=direction, param_type=param.type.format())
+            return Param(
+                name=param_name,
+                desc=param_desc_block,
+                direction=direction,
+                param_type=sys.intern(param.type.format()),
+            )
 
         return None
 
@@ -199,17 +227,19 @@ class MethodDoc(EntityDoc):
         kwargs, commands_and_data = super()._from_doxygen_string(method.doxygen)
         kwargs["name"] = method.name.format()
         params = []
+        returns = None
 
-        kwargs["returns"] = next((cmd.doc for cmd in commands_and_data if cmd.name in ["return", "returns"]), None)
-
-        param_docs = [cmd for cmd in commands_and_data if cmd.name.startswith("param")]
-        for param_doc in param_docs:
-            if param := cls.parse_param(param_doc, method.parameters):
-                params.append(param)
+        for cmd in commands_and_data:
+            if cmd.name.startswith("param"):
+                if param := cls.parse_param(cmd, method.parameters):
+                    params.append(param)
+            elif returns is None and cmd.name in ["return", "returns"]:
+                returns = cmd.doc
 
+        kwargs["returns"] = returns
         kwargs["params"] = params
         if method.return_type:
-            kwargs["return_type"] = method.return_type.format()
+            kwargs["return_type"] = sys.intern(method.return_type.format())
 
         for attr in [
             "static",
@@ -254,7 +284,7 @@ class AttributeDoc(EntityDoc):
     def parse(cls, field_scope: Field) -> "AttributeDoc":
         kwargs, _ = cls._from_doxygen_string(field_scope.doxygen)
 
-        return cls(name=field_scope.name or "Unknown", attribute_type=field_scope.type.format(), **kwargs)
+        return cls(name=field_scope.name or "Unknown", attribute_type=sys.intern(field_scope.type.format()), **kwargs)
 
 
 @dataclass
@@ -280,10 +310,10 @@ class EnumDoc(EntityDoc):
         enum_name = enum_decl.typename.segments[-1].format()
         for cmd in commands_and_data:
             if cmd.name == "enum" and cmd.doc:
-                enum_name_and_desc = cmd.doc.elements[0].text.split(" ", 1)
-                if enum_name_and_desc[0] != enum_name:
+                cmd_enum_name, separator, _ = cmd.doc.elements[0].text.partition(" ")
+                if cmd_enum_name != enum_name:
                     return None
-                if len(enum_name_and_desc) > 1 and isinstance(kwargs["desc"], DocBlock):
+                if separator and isinstance(kwargs["desc"], DocBlock):
                     kwargs["desc"] = DocBlock(elements=cmd.doc.elements + kwargs["desc"].elements)
 
         kwargs["name"] = enum_name
@@ -324,11 +354,9 @@ class ClassDoc(EntityDoc):
         if next_token is None:
             return None
 
-        if next_token.endswith("()") and (
-            method := next((m for m in self.public_methods if m.name == next_token.rstrip("()")), None)
-        ):
+        if next_token.endswith("()") and (method := self._public_methods_by_name.get(next_token[:-2])):
             return method
-        elif attribute := next((attr for attr in self.public_attributes if attr.name == next_token), None):
+        elif attribute := self._public_attributes_by_name.get(next_token):
             return attribute
         elif next_token in self.public_enums:
             return self.public_enums[next_token]
@@ -340,34 +368,31 @@ class ClassDoc(EntityDoc):
         # ruff: noqa: C901
         kwargs, commands_and_data = super()._from_doxygen_string(class_scope.class_decl.doxygen)
 
-        name_segment = class_scope.class_decl.typename.segments[-1]
-        if isinstance(name_segment, AnonymousName):
+        segments = class_scope.class_decl.typename.segments
+        if isinstance(segments[-1], AnonymousName):
             return None
 
-        class_name = name_segment.format()
+        formatted_segments = [seg.format() for seg in segments]
+        class_name = formatted_segments[-1]
         kwargs["name"] = class_name
-        kwargs["full_name"] = "::".join(seg.format() for seg in class_scope.class_decl.typename.segments)
+        kwargs["full_name"] = sys.intern("::".join(formatted_segments))
 
         for cmd in commands_and_data:
             if cmd.name == "class" and cmd.doc:
-                class_name_and_desc = cmd.doc.elements[0].text.split(" ", 1)
-                if class_name_and_desc[0] != class_name:
+                cmd_class_name, separator, class_desc = cmd.doc.elements[0].text.partition(" ")
+                if cmd_class_name != class_name:
                     return None
-                if len(class_name_and_desc) > 1:
-                    elements = [DocElement(text=class_name_and_desc[1], element_type="text")] + cmd.doc.elements[1:]
+                if separator:
+                    elements = [DocElement(text=class_desc, element_type="text")] + cmd.doc.elements[1:]
                     kwargs["desc"] = DocBlock(elements=elements)
 
-        public_methods = []
-        for method in class_scope.methods:
-            if not method.doxygen or method.access != "public":
-                continue
-            if method_doc := MethodDoc.parse(method):
-                public_methods.append(method_doc)
+        public_methods = [
+            method_doc
+            for method in class_scope.methods
+            if method.access == "public" and method.doxygen and (method_doc := MethodDoc.parse(method))
+        ]
 
-        public_attributes = []
-        for fld in class_scope.fields:
-            if fld.access == "public":
-                public_attributes.append(AttributeDoc.parse(fld))
+        public_attributes = [AttributeDoc.parse(fld) for fld in class_scope.fields if fld.access == "public"]
 
         public_enums = {}
         for enum in class_scope.enums:
@@ -379,7 +404,7 @@ class ClassDoc(EntityDoc):
         kwargs["public_enums"] = public_enums
         kwargs["class_key"] = class_scope.class_decl.typename.classkey
         kwargs["base_classes"] = [
-            base_class.typename.segments[-1].format() for base_class in class_scope.class_decl.bases
+            sys.intern(base_class.typename.segments[-1].format()) for base_class in class_scope.class_decl.bases
         ]
         kwargs["namespace"] = namespace
 
@@ -397,11 +422,9 @@ class ClassDoc(EntityDoc):
         if next_token is None:
             return self
 
-        if next_token.endswith("()") and (
-            method := next((m for m in self.public_methods if m.name == next_token.rstrip("()")), None)
-        ):
+        if next_token.endswith("()") and (method := self._public_methods_by_name.get(next_token[:-2])):
             return method
-        elif attribute := next((attr for attr in self.public_attributes if attr.name == next_token), None):
+        elif attribute := self._public_attributes_by_name.get(next_token):
             return attribute
         elif next_token in self.public_enums:
             return self.public_enums[next_token]
@@ -425,19 +448,33 @@ class ClassDoc(EntityDoc):
         for public_enum in self.public_enums.values():
             public_enum.post_process(namespace_docs, code_template, class_link)
 
+    @cached_property
+    def _public_methods_by_name(self) -> dict[str, MethodDoc]:
+        result: dict[str, MethodDoc] = {}
+        for method in self.public_methods:
+            result.setdefault(method.name, method)
+        return result
+
+    @cached_property
+    def _public_attributes_by_name(self) -> dict[str, AttributeDoc]:
+        result: dict[str, AttributeDoc] = {}
+        for attr in self.public_attributes:
+            result.setdefault(attr.name, attr)
+        return result
+
     @cached_property
     def inheritance_tree(self) -> list["ClassDoc"]:
-        result = [self]
-        for base_class in self.base_classes:
-            if base_class not in self.namespace.classes:
+        result = {self.full_name: self}
+        pending = list(reversed(self.base_classes))
+        while pending:
+            base_class_doc = self.namespace.classes.get(pending.pop())
+            if base_class_doc is None or base_class_doc.full_name in result:
                 continue
 
-            base_inheritance_tree = self.namespace.classes[base_class].inheritance_tree
-            for cls in base_inheritance_tree:
-                if cls not in result:
-                    result.append(cls)
+            result[base_class_doc.full_name] = base_class_doc
+            pending.extend(reversed(base_class_doc.base_classes))
 
-        return result
+        return list(result.values())
 
 
 @dataclass
@@ -471,15 +508,15 @@ class NamespaceDoc(EntityDoc):
             if not namespace_command.doc.elements:
                 return None
 
-            namespace_name_and_desc = namespace_command.doc.elements[0].text.split(" ", 1)
+            namespace_name, separator, namespace_desc = namespace_command.doc.elements[0].text.partition(" ")
 
             # namespace name doesn't match
-            if namespace_name_and_desc[0] != namespace_scope.name:
+            if namespace_name != namespace_scope.name:
                 return None
 
             # append rest of text to desc
-            if len(namespace_name_and_desc) > 1:
-                new_element = DocElement(text=namespace_name_and_desc[1], element_type="text")
+            if separator:
+                new_element = DocElement(text=namespace_desc, element_type="text")
                 if "desc" in kwargs and kwargs["desc"]:
                     kwargs["desc"].elements.insert(0, new_element)
                 else:
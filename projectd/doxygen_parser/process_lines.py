@@ -1,24 +1,40 @@
 import re
+import sys
+from functools import lru_cache
 
-from projectd.doxygen_parser.dataclasses import CommandDoc, DocElement
+from projectd.doxygen_parser.dataclasses import CommandDoc, DocElement, ElementType
 
+_BLOCK_COMMENT_RE = re.compile(r"/\*[*!]?|\*/")
 
+_LIST_ITEM_CHARS = frozenset("-+*")
+_BLOCK_START_CHARS = frozenset("\\@") | _LIST_ITEM_CHARS
+
+_ELEMENT_KEYWORDS: dict[str, ElementType] = {"verbatim": "verbatim", "code": "code", "li": "text"}
+
+
+@lru_cache(maxsize=8192)
 def _remove_comment_chars_from_line(line: str) -> str:
     line = line.strip()
     if line.startswith("//!<") or line.startswith("///<"):
         line = line[4:]
     elif line.startswith("///"):
         line = line[3:]
-    else:
-        line = line.replace("/**", "").replace("/*!", "").replace("/*", "").replace("*/", "")
+    elif "/*" in line or "*/" in line:
+        line = _BLOCK_COMMENT_RE.sub("", line)
 
     return line.strip("*")
 
 
 def _preprocess_lines(lines: list[str]) -> list[str]:
+    return list(_preprocess_line_tuple(tuple(lines)))
+
+
+@lru_cache(maxsize=1024)
+def _preprocess_line_tuple(lines: tuple[str, ...]) -> tuple[str, ...]:
     # ruff: noqa: C901
     result: list[str] = []
-    cur_line = ""
+    cur_parts: list[str] = []
+    cur_sep = ""
     block_type = None
 
     chars_from_original_line = 0
@@ -32,46 +48,35 @@ def _preprocess_lines(lines: list[str]) -> list[str]:
                 if line_without_end_verbatim := line.replace("\\endverbatim", "").replace("@endverbatim", "")[
                     chars_from_original_line:
                 ]:
-                    cur_line = "\n".join([cur_line, line_without_end_verbatim])
+                    cur_parts.append(line_without_end_verbatim)
 
-                result.append(cur_line)
-                cur_line = ""
+                result.append(cur_sep.join(cur_parts))
+                cur_parts = []
             else:
-                verbatim_line = line[chars_from_original_line:]
-                cur_line = "\n".join([cur_line, verbatim_line]) if cur_line else verbatim_line
+                cur_parts.append(line[chars_from_original_line:])
 
             continue
 
         if block_type == "code":
             if "\\endcode" in line or "@endcode" in line:
                 block_type = None
-                result.append(cur_line)
-                cur_line = ""
+                result.append(cur_sep.join(cur_parts))
+                cur_parts = []
             else:
-                code_line = line[chars_from_original_line:]
-                cur_line = "\n".join([cur_line, code_line]) if cur_line else code_line
+                cur_parts.append(line[chars_from_original_line:])
 
             continue
 
         stripped_line = _remove_comment_chars_from_line(line)
         fully_stripped_line = stripped_line.lstrip()
 
-        if block_type == "other":
-            if not fully_stripped_line or fully_stripped_line.startswith(("\\", "@", "-", "+", "*")):
+        if block_type == "other" or block_type == "list":
+            if not fully_stripped_line or fully_stripped_line[0] in _BLOCK_START_CHARS:
                 block_type = None
-                result.append(cur_line)
-                cur_line = ""
+                result.append(cur_sep.join(cur_parts))
+                cur_parts = []
             else:
-                cur_line = " ".join([cur_line, fully_stripped_line]) if cur_line else fully_stripped_line
-                continue
-
-        if block_type == "list":
-            if not fully_stripped_line or fully_stripped_line.startswith(("\\", "@", "-", "+", "*")):
-                block_type = None
-                result.append(cur_line)
-                cur_line = ""
-            else:
-                cur_line = " ".join([cur_line, fully_stripped_line]) if cur_line else fully_stripped_line
+                cur_parts.append(fully_stripped_line)
                 continue
 
         if not fully_stripped_line:
@@ -82,29 +87,34 @@ def _preprocess_lines(lines: list[str]) -> list[str]:
         if fully_stripped_line.startswith(("\\verbatim", "@verbatim")):
             block_type = "verbatim"
             chars_from_original_line = max(original_line.find("@verbatim"), original_line.find("\\verbatim"))
-            cur_line = fully_stripped_line
+            cur_parts = [fully_stripped_line]
+            cur_sep = "\n"
         elif fully_stripped_line.startswith(("\\code", "@code")):
             block_type = "code"
             chars_from_original_line = max(original_line.find("@code"), original_line.find("\\code"))
-            cur_line = fully_stripped_line
-        elif fully_stripped_line.startswith(("-", "+", "*")):
+            cur_parts = [fully_stripped_line]
+            cur_sep = "\n"
+        elif fully_stripped_line[0] in _LIST_ITEM_CHARS:
             block_type = "list"
-            cur_line = f"@li {stripped_line}"
+            cur_parts = [f"@li {stripped_line}"]
+            cur_sep = " "
         else:
             block_type = "other"
-            cur_line = fully_stripped_line
+            cur_parts = [fully_stripped_line]
+            cur_sep = " "
 
-    if cur_line:
-        result.append(cur_line)
+    if cur_parts:
+        result.append(cur_sep.join(cur_parts))
 
-    return result
+    return tuple(result)
 
 
 def _get_keyword_and_rest_of_line(line: str) -> tuple[str, str]:
     if line.startswith(("\\", "@")):
-        keyword_and_rest_of_line = re.split(" |\n", line, maxsplit=1)
-        rest_of_line = keyword_and_rest_of_line[1] if len(keyword_and_rest_of_line) > 1 else ""
-        return keyword_and_rest_of_line[0][1:], rest_of_line
+        keyword, _, rest_of_line = line[1:].partition(" ")
+        if "\n" in keyword:
+            keyword, _, rest_of_line = line[1:].partition("\n")
+        return sys.intern(keyword), rest_of_line
 
     return "", line
 
@@ -112,34 +122,24 @@ def _get_keyword_and_rest_of_line(line: str) -> tuple[str, str]:
 def process_lines(lines: list[str]) -> list[CommandDoc]:
     lines = _preprocess_lines(lines)
 
-    commands = []
     anonymous_command = CommandDoc(name="")
+    commands = [anonymous_command]
     cur_command = anonymous_command
 
     for line in lines:
-        if cur_command not in commands:
-            commands.append(cur_command)
-
         keyword, rest_of_line = _get_keyword_and_rest_of_line(line)
 
-        match keyword:
-            case "blank":
-                cur_command = anonymous_command
-            case "":
-                cur_command = anonymous_command
-                cur_command.doc.elements.append(DocElement(text=rest_of_line, element_type="text"))
-            case "verbatim":
-                cur_command.doc.elements.append(DocElement(text=rest_of_line, element_type="verbatim"))
-            case "code":
-                cur_command.doc.elements.append(DocElement(text=rest_of_line, element_type="code"))
-            case "li":
+        if element_type := _ELEMENT_KEYWORDS.get(keyword):
+            cur_command.doc.elements.append(DocElement(text=rest_of_line, element_type=element_type))
+        elif keyword == "":
+            cur_command = anonymous_command
+            cur_command.doc.elements.append(DocElement(text=rest_of_line, element_type="text"))
+        elif keyword == "blank":
+            cur_command = anonymous_command
+        else:
+            cur_command = CommandDoc(name=keyword)
+            commands.append(cur_command)
+            if rest_of_line:
                 cur_command.doc.elements.append(DocElement(text=rest_of_line, element_type="text"))
-            case _:
-                cur_command = CommandDoc(name=keyword)
-                if rest_of_line:
-                    cur_command.doc.elements.append(DocElement(text=rest_of_line, element_type="text"))
-
-    if cur_command not in commands:
-        commands.append(cur_command)
 
     return [command for command in commands if command.name or command.doc.elements]
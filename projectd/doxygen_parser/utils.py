@@ -1,9 +1,14 @@
 from typing import Callable
 
+_LEADING_PUNCTUATION = ";,'\"()[]{}"
+_TRAILING_PUNCTUATION = ";,'\".?!:"
+
 
 def modify_sentence(sentence: str, update_word_callback: Callable[[str], str]) -> str:
-    words = sentence.split()
-    stripped_words = [word.lstrip(";,'\"()[]{}").rstrip(";,'\".?!:") for word in words]
-    modified_words = [update_word_callback(word) for word in stripped_words]
-    words = [word.replace(stripped_words[index], modified_words[index]) for index, word in enumerate(words) if word]
-    return " ".join(words)
+    modified_words = []
+    for word in sentence.split():
+        start = len(word) - len(word.lstrip(_LEADING_PUNCTUATION))
+        stripped_word = word[start:].rstrip(_TRAILING_PUNCTUATION)
+        end = start + len(stripped_word)
+        modified_words.append(word[:start] + update_word_callback(stripped_word) + word[end:])
+    return " ".join(modified_words)
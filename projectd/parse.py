@@ -1,12 +1,14 @@
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
 from dataclasses import dataclass
-from typing import Callable
+from itertools import repeat
+from typing import Callable, Iterator
 
 from cxxheaderparser.options import ParserOptions
 from cxxheaderparser.preprocessor import make_pcpp_preprocessor
-from cxxheaderparser.simple import parse_file
+from cxxheaderparser.simple import ParsedData, parse_file
 
 from projectd.doxygen_parser import ClassDoc, EnumDoc, FileDoc, NamespaceDoc
 
@@ -29,34 +31,43 @@ def get_base_classes(ns: NamespaceDoc, class_doc: ClassDoc) -> list[str]:
     return result
 
 
+def _iter_files(directory_paths: list[str]) -> Iterator[tuple[str, str]]:
+    for directory_path in directory_paths:
+        for root, _, files in os.walk(directory_path):
+            relative_root = os.path.relpath(root, start=directory_path)
+            for file in files:
+                relative_file_path = file if relative_root == os.curdir else os.path.join(relative_root, file)
+                yield relative_file_path, os.path.join(root, file)
+
+
+def _parse_file(file_path: str, defines: list[str]) -> ParsedData | None:
+    # runs in a worker process, the preprocessor function cannot be pickled
+    preprocessor = make_pcpp_preprocessor(passthru_includes=re.compile(".+"), defines=defines)
+    try:
+        return parse_file(file_path, options=ParserOptions(preprocessor=preprocessor))
+    except Exception:
+        # a file that cannot be parsed is skipped, it does not abort the whole run
+        return None
+
+
 def parse(directory_paths: list[str], defines: list[str] | None = None) -> ParsedDocData:
     # ruff: noqa: C901
 
     if defines is None:
         defines = []
-    preprocessor = make_pcpp_preprocessor(passthru_includes=re.compile(".+"), defines=defines)
-
-    options = ParserOptions(preprocessor=preprocessor)
 
     namespaces = {}
     classes = {}
     files = {}
     enums = {}
 
-    for directory_path in directory_paths:
-        file_list = [
-            os.path.relpath(os.path.join(root, file), start=directory_path)
-            for root, _, files in os.walk(directory_path)
-            for file in files
-        ]
-
-        for file_path in file_list:
-            print(f"parsing {file_path}...")
-            file_path = os.path.join(directory_path, file_path)
-            try:
-                data = parse_file(file_path, options=options)
-            except:
-                # ruff: noqa: E722
+    file_list = list(_iter_files(directory_paths))
+
+    with ProcessPoolExecutor() as executor:
+        parsed_files = executor.map(_parse_file, [file_path for _, file_path in file_list], repeat(defines))
+        for (relative_file_path, file_path), data in zip(file_list, parsed_files):
+            print(f"parsing {relative_file_path}...")
+            if data is None:
                 print(f"{file_path} cannot be parsed!!!!!!!!!!")
                 continue
 
@@ -1,26 +1,51 @@
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
 from shutil import rmtree
+from typing import Iterable
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 from projectd.config import TemplateType, get_config
 from projectd.parse import parse, post_process
 
 
 def _delete_current_files(directory_path: str) -> None:
-    for item in os.listdir(directory_path):
-        item_path = os.path.join(directory_path, item)
+    with os.scandir(directory_path) as entries:
+        for entry in entries:
+            if entry.is_file():
+                os.remove(entry.path)
 
-        if os.path.isfile(item_path):
-            os.remove(item_path)
+            elif entry.is_dir():
+                rmtree(entry.path)
 
-        elif os.path.isdir(item_path):
-            rmtree(item_path)
+
+def _make_parent_dirs(file_paths: Iterable[str]) -> None:
+    for directory_path in {os.path.dirname(file_path) for file_path in file_paths}:
+        os.makedirs(directory_path, exist_ok=True)
+
+
+def _write_file(file_path: str, content: str) -> None:
+    with open(file_path, "w") as f:
+        f.write(content)
+
+
+def _write_files(files: Iterable[tuple[str, str]]) -> None:
+    # pages written concurrently to the same path would race, keep the last one like sequential writes did
+    last_files = dict(files)
+    with ThreadPoolExecutor() as executor:
+        for future in [executor.submit(_write_file, file_path, content) for file_path, content in last_files.items()]:
+            future.result()
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    return re.compile(pattern)
 
 
 def _regex_replace(string: str, find: str, replace: str):  # type: ignore[no-untyped-def]
-    return re.sub(find, replace, string)
+    return _compile_pattern(find).sub(replace, string)
 
 
 def run() -> None:
@@ -28,7 +53,12 @@ def run() -> None:
 
     template_loader = FileSystemLoader(searchpath=config.template_dir)
     env = Environment(
-        loader=template_loader, trim_blocks=True, lstrip_blocks=True, autoescape=config.auto_escape  # noqa: S701
+        loader=template_loader,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        autoescape=config.auto_escape,  # noqa: S701
+        bytecode_cache=FileSystemBytecodeCache(),
+        auto_reload=False,
     )
     env.filters["regex_replace"] = _regex_replace
 
@@ -37,41 +67,41 @@ def run() -> None:
     _delete_current_files(config.output_dir)
 
     code_template = env.get_template(config.code_template)
+    render_code = cache(lambda v: code_template.render(value=v))
     for template_config in config.templates:
         template = env.get_template(template_config.template)
         class_link_template = env.get_template(template_config.class_link_template)
         post_processed_parsed_data = post_process(
             parsed_data,
-            lambda v: code_template.render(value=v),
+            render_code,
             # ruff: noqa: B023
-            lambda word, namespace, klass, method: class_link_template.render(
-                word=word, namespace=namespace, klass=klass, method=method
+            cache(
+                lambda word, namespace, klass, method: class_link_template.render(
+                    word=word, namespace=namespace, klass=klass, method=method
+                )
             ),
         )
 
         if template_config.template_type == TemplateType.CLASS:
-            for ns in post_processed_parsed_data.namespaces.values():
-                for cls in ns.classes.values():
-                    file_path = os.path.join(
-                        config.output_dir, template_config.output_file.replace("{class_name}", cls.name)
-                    )
-                    os.makedirs(os.path.dirname(file_path), exist_ok=True)
-                    with open(file_path, "w") as f:
-                        f.write(template.render(klass=cls))
+            output_file_parts = template_config.output_file.split("{class_name}")
+            class_output_files = [
+                (os.path.join(config.output_dir, cls.name.join(output_file_parts)), cls)
+                for ns in post_processed_parsed_data.namespaces.values()
+                for cls in ns.classes.values()
+            ]
+            _make_parent_dirs(file_path for file_path, _ in class_output_files)
+            _write_files((file_path, template.render(klass=cls)) for file_path, cls in class_output_files)
 
         elif template_config.template_type == TemplateType.FILE:
-            for file in post_processed_parsed_data.files.values():
-                file_path = os.path.join(
-                    config.output_dir, template_config.output_file.replace("{file_name}", file.name)
-                )
-                if "SSLLayer.h" in file_path:
-                    print(file_path)
-                os.makedirs(os.path.dirname(file_path), exist_ok=True)
-                with open(file_path, "w") as f:
-                    f.write(template.render(file=file))
+            output_file_parts = template_config.output_file.split("{file_name}")
+            file_output_files = [
+                (os.path.join(config.output_dir, file.name.join(output_file_parts)), file)
+                for file in post_processed_parsed_data.files.values()
+            ]
+            _make_parent_dirs(file_path for file_path, _ in file_output_files)
+            _write_files((file_path, template.render(file=file)) for file_path, file in file_output_files)
 
         elif template_config.template_type == TemplateType.ENUMS:
             file_path = os.path.join(config.output_dir, template_config.output_file)
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            with open(file_path, "w") as f:
-                f.write(template.render(enums=post_processed_parsed_data.enums.values()))
+            _write_file(file_path, template.render(enums=post_processed_parsed_data.enums.values()))
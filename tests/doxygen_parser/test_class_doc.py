@@ -0,0 +1,86 @@
+from cxxheaderparser.simple import parse_string
+
+from projectd.doxygen_parser import ClassDoc, NamespaceDoc
+
+
+class TestClassDocInheritanceTree:
+    @staticmethod
+    def _parse_namespace(content: str) -> NamespaceDoc:
+        namespace_scope = parse_string(content).namespace.namespaces["foo"]
+        namespace_doc = NamespaceDoc.parse(namespace_scope)
+        assert namespace_doc is not None
+
+        for class_scope in namespace_scope.classes:
+            class_doc = ClassDoc.parse(class_scope, namespace_doc)
+            assert class_doc is not None
+            namespace_doc.classes[class_doc.name] = class_doc
+
+        return namespace_doc
+
+    def test_diamond_inheritance(self) -> None:
+        content = """
+        namespace foo {
+        /// Base class
+        class Base {};
+        /// Left class
+        class Left : public Base {};
+        /// Right class
+        class Right : public Base {};
+        /// Derived class
+        class Derived : public Left, public Right {};
+        }
+        """
+
+        inheritance_tree = self._parse_namespace(content).classes["Derived"].inheritance_tree
+        assert [cls.name for cls in inheritance_tree] == ["Derived", "Left", "Base", "Right"]
+
+    def test_deep_inheritance_with_unknown_base(self) -> None:
+        content = """
+        namespace foo {
+        /// Root class
+        class Root {};
+        /// Base class
+        class Base : public Root, public std::enable_shared_from_this<Base> {};
+        /// Mixin class
+        class Mixin {};
+        /// Left class
+        class Left : public Base {};
+        /// Right class
+        class Right : public Mixin, public Base {};
+        /// Derived class
+        class Derived : public Left, public Right {};
+        }
+        """
+
+        inheritance_tree = self._parse_namespace(content).classes["Derived"].inheritance_tree
+        assert [cls.name for cls in inheritance_tree] == ["Derived", "Left", "Base", "Root", "Right", "Mixin"]
+
+
+class TestClassDocFindTokenReference:
+    def test_find_members(self) -> None:
+        content = """
+        namespace foo {
+        /// Class description
+        class Klass {
+        public:
+            /// First overload
+            void method();
+            /// Second overload
+            void method(int x);
+            /// Attribute description
+            int attribute;
+        };
+        }
+        """
+
+        namespace_scope = parse_string(content).namespace.namespaces["foo"]
+        namespace_doc = NamespaceDoc.parse(namespace_scope)
+        assert namespace_doc is not None
+        class_doc = ClassDoc.parse(namespace_scope.classes[0], namespace_doc)
+        assert class_doc is not None
+
+        assert class_doc.find_token_reference([]) is class_doc
+        assert class_doc.find_token_reference(["method()"]) is class_doc.public_methods[0]
+        assert class_doc.find_token_reference(["attribute"]) is class_doc.public_attributes[0]
+        assert class_doc.find_token_reference(["method"]) is None
+        assert class_doc.find_token_reference(["unknown()"]) is None
@@ -29,6 +29,7 @@ from projectd.doxygen_parser.process_lines import (
         ("/** line */", " line "),
         ("line */", "line "),
         ("/**** line ****/", " line "),
+        ("a*/**b", "a**b"),
     ],
 )
 def test_remove_comment_chars_from_line(line: str, expected: str) -> None:
@@ -401,3 +402,16 @@ class TestProcessLines:
         ]
 
         assert process_lines(preprocessed_lines) == expected
+
+    def test_repeated_identical_commands(self, mock_preprocess_lines: Any) -> None:
+        preprocessed_lines = [
+            "@keyword1 some text",
+            "@keyword1 some text",
+        ]
+
+        expected = [
+            CommandDoc(name="keyword1", doc=DocBlock(elements=[DocElement(element_type="text", text="some text")])),
+            CommandDoc(name="keyword1", doc=DocBlock(elements=[DocElement(element_type="text", text="some text")])),
+        ]
+
+        assert process_lines(preprocessed_lines) == expected
@@ -0,0 +1,8 @@
+from projectd.doxygen_parser.utils import modify_sentence
+
+
+class TestModifySentence:
+    def test_modify_sentence(self) -> None:
+        sentence = '  See (Foo::bar()), Baz and  "qux".  '
+
+        assert modify_sentence(sentence, str.upper) == 'SEE (FOO::BAR()), BAZ AND "QUX".'
@@ -0,0 +1,20 @@
+from pathlib import Path
+
+from projectd.run import _write_files
+
+
+class TestWriteFiles:
+    def test_write_files(self, tmp_path: Path) -> None:
+        _write_files([(str(tmp_path / "a.md"), "page a"), (str(tmp_path / "b.md"), "page b")])
+
+        assert (tmp_path / "a.md").read_text() == "page a"
+        assert (tmp_path / "b.md").read_text() == "page b"
+
+    def test_last_page_for_same_path_wins(self, tmp_path: Path) -> None:
+        file_path = str(tmp_path / "page.md")
+
+        _write_files([(file_path, "first page\n" * 100000), (file_path, "second page")])
+        assert (tmp_path / "page.md").read_text() == "second page"
+
+        _write_files([(file_path, "third page"), (file_path, "fourth page\n" * 100000)])
+        assert (tmp_path / "page.md").read_text() == "fourth page\n" * 100000